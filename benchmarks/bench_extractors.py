@@ -0,0 +1,115 @@
+"""Compare the library and ooxml DOCX/PPTX extractors.
+
+Usage: python benchmarks/bench_extractors.py [--paragraphs N] [--slides N] [--repeat N]
+
+Memory is the growth in peak resident set size while one extraction runs in
+a fresh subprocess. RSS includes the C-level allocations of lxml, which
+tracemalloc does not see. Unix only (`resource` and `os.fork`).
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from docx import Document
+from pptx import Presentation
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from doc_gpt.ooxml import extract_docx_text, extract_pptx_text  # noqa: E402
+from doc_gpt.utils import process_docx, process_pptx  # noqa: E402
+
+
+def build_docx(path, paragraphs):
+    doc = Document()
+    for i in range(paragraphs):
+        doc.add_paragraph(f"Paragraph {i}\twith a tab and some more text to read")
+    doc.save(str(path))
+
+
+def build_pptx(path, slides):
+    prs = Presentation()
+    for i in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i}"
+        slide.placeholders[1].text = "\n".join(f"Bullet {j}" for j in range(10))
+    prs.save(str(path))
+
+
+EXTRACTORS = {
+    "process_docx": process_docx,
+    "extract_docx_text": extract_docx_text,
+    "process_pptx": process_pptx,
+    "extract_pptx_text": extract_pptx_text,
+}
+
+
+def max_rss_kib():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return rss / 1024 if sys.platform == "darwin" else rss
+
+
+def measure_time(func, path, repeat):
+    func(path)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(path)
+    return (time.perf_counter() - start) / repeat
+
+
+def measure_rss(func, path):
+    output = subprocess.run(
+        [sys.executable, __file__, "--rss-child", func.__name__, str(path)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def rss_child(func_name, path):
+    # The imports of doc_gpt.utils peak higher than one extraction and ru_maxrss
+    # never goes down, so extract in a fork, whose peak starts at the current RSS.
+    pid = os.fork()
+    if pid == 0:
+        baseline = max_rss_kib()
+        EXTRACTORS[func_name](path)
+        print(max_rss_kib() - baseline, flush=True)
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=3000)
+    parser.add_argument("--slides", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--rss-child", nargs=2, metavar=("FUNC", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.rss_child:
+        rss_child(*args.rss_child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docx_path = Path(tmp) / "bench.docx"
+        pptx_path = Path(tmp) / "bench.pptx"
+        build_docx(docx_path, args.paragraphs)
+        build_pptx(pptx_path, args.slides)
+
+        cases = [
+            (f"docx ({args.paragraphs} paragraphs)", docx_path, process_docx, extract_docx_text),
+            (f"pptx ({args.slides} slides)", pptx_path, process_pptx, extract_pptx_text),
+        ]
+        for name, path, library, ooxml in cases:
+            for label, func in (("library", library), ("ooxml", ooxml)):
+                seconds = measure_time(func, path, args.repeat)
+                rss = measure_rss(func, path)
+                print(f"{name:<24} {label:<8} {seconds * 1000:8.1f} ms  {rss / 1024:8.1f} MiB peak RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ import google.generativeai as genai
 class AIClient:
     def __init__(self, config):
         self.config = config
+        # Token usage of the most recent request: {"input_tokens": ..., "output_tokens": ...}
+        self.last_usage = None
 
     def request(self, messages, model_alias=None, max_tokens=None):
         if not model_alias:
@@ -24,6 +26,7 @@ class AIClient:
             raise ValueError(f"Provider not specified for model alias '{model_alias}'")
         
         print(f"Requesting content from model '{model_alias}' using provider '{provider}'")
+        self.last_usage = None
 
         if provider == 'openai':
             return self._openai_request(messages, model_config, max_tokens)
@@ -52,6 +55,7 @@ class AIClient:
                 messages=messages,
                 stream=False,
                 max_tokens=max_tokens)
+        self._set_openai_usage(response)
         return response.choices[0].message.content
 
     def _azure_openai_request(self, messages, model_config, max_tokens):
@@ -76,6 +80,7 @@ class AIClient:
             stream=False,
             max_tokens=max_tokens
         )
+        self._set_openai_usage(response)
         return response.choices[0].message.content
 
     def _ollama_request(self, messages, model_config, max_tokens):
@@ -102,6 +107,10 @@ class AIClient:
                     if 'message' in json_obj and 'content' in json_obj['message']:
                         full_response += json_obj['message']['content']
                     if json_obj.get('done', False):
+                        self.last_usage = {
+                            "input_tokens": json_obj.get('prompt_eval_count'),
+                            "output_tokens": json_obj.get('eval_count'),
+                        }
                         break
                 except json.JSONDecodeError:
                     print(f"Error decoding JSON line: {line}")
@@ -128,6 +137,10 @@ class AIClient:
             max_tokens=max_tokens or model_config.get('max_tokens', 1024),
             messages=anthropic_messages
         )
+        self.last_usage = {
+            "input_tokens": response.usage.input_tokens,
+            "output_tokens": response.usage.output_tokens,
+        }
         return response.content
 
     def _google_generativeai_request(self, messages, model_config, max_tokens):
@@ -145,4 +158,18 @@ class AIClient:
             generation_config['max_output_tokens'] = max_tokens
 
         response = model.generate_content(prompt, generation_config=generation_config)
-        return response.text
\ No newline at end of file
+        usage = getattr(response, 'usage_metadata', None)
+        if usage:
+            self.last_usage = {
+                "input_tokens": usage.prompt_token_count,
+                "output_tokens": usage.candidates_token_count,
+            }
+        return response.text
+
+    def _set_openai_usage(self, response):
+        # OpenAI-compatible servers may omit usage entirely
+        if response.usage:
+            self.last_usage = {
+                "input_tokens": response.usage.prompt_tokens,
+                "output_tokens": response.usage.completion_tokens,
+            }
\ No newline at end of file
@@ -9,7 +9,8 @@ from .config import (
     set_default_model,
     show_models_command,
 )
-from .utils import process_task, is_valid_url, process_input
+from .store import open_store
+from .utils import EXTRACTORS, export_store, process_task, is_valid_url, process_input
 
 @click.group()
 def main():
@@ -71,18 +72,38 @@ def show_models():
     type=int,
     help="Max output tokens for all supported provider's requests (default is None)"
 )
-def g(input_path, output_file, model_alias, prompt_file, instructions_file, batch_size, write_prompt, max_tokens):
+@click.option(
+    "-x",
+    "--extractor",
+    default="library",
+    type=click.Choice(EXTRACTORS),
+    help="DOCX/PPTX text extractor: 'library' uses python-docx/python-pptx, 'ooxml' streams the XML parts directly and also reads tables, notes, headers and footnotes (default is library)"
+)
+@click.option(
+    "-os",
+    "--output-store",
+    "--output_store",
+    "output_store",
+    help="Store responses in a SQLite (.db, .sqlite, .sqlite3) or JSONL (.jsonl) file instead of writing Markdown files"
+)
+def g(input_path, output_file, model_alias, prompt_file, instructions_file, batch_size, write_prompt, max_tokens, extractor, output_store):
     """Generate content using the specified model and input."""
 
     def process_file(file, output_file_param):
         if output_file_param is None:
           output_file_param = str(Path.cwd() / (file.stem + ".doc-gpt.md"))
-        process_task(str(file), output_file_param, model_alias, prompt_file, instructions_file, write_prompt, max_tokens)
+        process_task(str(file), output_file_param, model_alias, prompt_file, instructions_file, write_prompt, max_tokens, extractor, store)
 
+    store = None
     try:
+        if output_store and output_file:
+            raise click.UsageError("--output cannot be used with --output-store; use 'doc-gpt export' to write files")
+
         if is_valid_url(input_path):
+            if output_store:
+                store = open_store(output_store)
             # If input is a URL, process it directly
-            process_task(input_path, output_file, model_alias, prompt_file, instructions_file, write_prompt, max_tokens)
+            process_task(input_path, output_file, model_alias, prompt_file, instructions_file, write_prompt, max_tokens, extractor, store)
             return
 
         # For file paths, validate existence
@@ -111,6 +132,11 @@ def g(input_path, output_file, model_alias, prompt_file, instructions_file, batc
             click.echo("No valid files found.", err=True)
             return
 
+        if output_store:
+            # Open once the inputs are known to be valid: fails on an unsupported
+            # store before spending any requests, and every task shares the connection
+            store = open_store(output_store)
+
         # Process the files in batches asynchronously
         for i in range(0, len(files), batch_size):
             batch_files = files[i : i + batch_size]
@@ -130,18 +156,28 @@ def g(input_path, output_file, model_alias, prompt_file, instructions_file, batc
         click.echo(str(e), err=True)
     except Exception as e:
         click.echo(f"An error occurred: {str(e)}", err=True)
+    finally:
+        if store:
+            store.close()
 
 
 @main.command(help="Extract text from document and output to .doc-gpt.txt file.")
 @click.argument("input_path", required=True, type=click.Path(exists=True))
 @click.option("-o", "--output", "output_file", help="Output file")
-def text(input_path, output_file):
+@click.option(
+    "-x",
+    "--extractor",
+    default="library",
+    type=click.Choice(EXTRACTORS),
+    help="DOCX/PPTX text extractor: 'library' uses python-docx/python-pptx, 'ooxml' streams the XML parts directly and also reads tables, notes, headers and footnotes (default is library)"
+)
+def text(input_path, output_file, extractor):
     """Extract text from document and output to .doc-gpt.txt file."""
     try:
         input_path_obj = Path(input_path)
         if output_file is None:
             output_file = str(Path.cwd() / (input_path_obj.stem + ".doc-gpt.txt")) # Changed this line
-        extracted_text = process_input(input_path)
+        extracted_text = process_input(input_path, extractor)
         with open(output_file, "w", encoding="utf-8") as f:
             f.write(extracted_text)
         click.echo(f"Text extracted and saved to {output_file}")
@@ -149,5 +185,18 @@ def text(input_path, output_file):
         click.echo(f"An error occurred: {str(e)}", err=True)
 
 
+@main.command(help="Export stored responses to .doc-gpt.md files.")
+@click.argument("store_path", required=True, type=click.Path(exists=True))
+@click.option("-o", "--output", "output_dir", help="Output directory (default is the current directory)")
+@click.option("-i", "--input", "input_file", help="Only export responses for this input path or URL")
+def export(store_path, output_dir, input_file):
+    """Export stored responses to .doc-gpt.md files."""
+    try:
+        count = export_store(store_path, output_dir, input_file)
+        click.echo(f"Exported {count} response(s) from {store_path}")
+    except Exception as e:
+        click.echo(f"An error occurred: {str(e)}", err=True)
+
+
 if __name__ == "__main__":
     main()
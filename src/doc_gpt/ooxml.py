@@ -0,0 +1,186 @@
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+NOTES_SLIDE_REL = R_NS + "/notesSlide"
+# Extra parts of a Word main part, in reading order after the body
+DOCX_EXTRA_RELS = ["footnotes", "endnotes", "header", "footer"]
+
+# Per-dialect tags: (paragraph, text runs, {character element: text}).
+# The characters follow python-docx Run.text and python-pptx _Paragraph.text.
+WORD_TAGS = (
+    f"{{{W_NS}}}p",
+    {f"{{{W_NS}}}t"},
+    {
+        f"{{{W_NS}}}br": "\n",
+        f"{{{W_NS}}}cr": "\n",
+        f"{{{W_NS}}}tab": "\t",
+        f"{{{W_NS}}}ptab": "\t",
+        f"{{{W_NS}}}noBreakHyphen": "-",
+    },
+)
+DRAWING_TAGS = (
+    f"{{{A_NS}}}p",
+    {f"{{{A_NS}}}t"},
+    {f"{{{A_NS}}}br": "\v"},
+)
+
+# Subtrees whose text is not part of the current document: mc:Fallback
+# duplicates the mc:Choice content (e.g. text boxes) and w:moveFrom holds
+# the old position of tracked moved text, which also appears in w:moveTo.
+SKIP_TAGS = {f"{{{MC_NS}}}Fallback", f"{{{W_NS}}}moveFrom"}
+W_BR = f"{{{W_NS}}}br"
+W_TYPE = f"{{{W_NS}}}type"
+W_VAL = f"{{{W_NS}}}val"
+P_SP = f"{{{P_NS}}}sp"
+P_PH = f"{{{P_NS}}}ph"
+
+
+def _char_text(elem, chars):
+    tag = elem.tag
+    if tag == W_BR and elem.get(W_TYPE, "textWrapping") != "textWrapping":
+        # Page and column breaks are not line breaks
+        return ""
+    if W_VAL in elem.attrib:
+        # w:tab with a w:val is a tab stop definition, not a tab character
+        return ""
+    return chars[tag]
+
+
+def iter_paragraphs(stream, tags, keep_empty=True, placeholder=None):
+    """Stream paragraph strings from an OOXML part without building the full tree.
+
+    With `placeholder`, only paragraphs of p:sp shapes whose p:ph has that type are read.
+    """
+    para_tag, text_tags, chars = tags
+    # Paragraphs nest (text boxes inside a run), so keep one buffer per open paragraph
+    stack = [[]]
+    parents = []
+    skip_depth = 0
+    shape_placeholder = None
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            parents.append(elem)
+            if tag in SKIP_TAGS:
+                skip_depth += 1
+            elif tag == para_tag and not skip_depth:
+                stack.append([])
+            elif tag == P_SP:
+                shape_placeholder = None
+            elif tag == P_PH:
+                shape_placeholder = elem.get("type")
+            continue
+
+        parents.pop()
+        if tag in SKIP_TAGS:
+            skip_depth -= 1
+        elif skip_depth:
+            pass
+        elif tag in text_tags:
+            stack[-1].append(elem.text or "")
+        elif tag in chars:
+            stack[-1].append(_char_text(elem, chars))
+        elif tag == para_tag:
+            text = "".join(stack.pop())
+            if (text or keep_empty) and (placeholder is None or shape_placeholder == placeholder):
+                yield text
+
+        # Everything needed from a finished element has been read, so detach it
+        # and keep memory bounded by the nesting depth rather than the part size.
+        if parents:
+            parents[-1].remove(elem)
+
+
+def _natural_key(name):
+    return [int(s) if s.isdigit() else s for s in re.split(r"(\d+)", name)]
+
+
+def _read_rels(archive, part_name):
+    directory, filename = posixpath.split(part_name)
+    rels_name = posixpath.join(directory, "_rels", filename + ".rels")
+    if rels_name not in archive.namelist():
+        return {}
+    with archive.open(rels_name) as f:
+        root = ET.parse(f).getroot()
+    rels = {}
+    for rel in root.iter(f"{{{PKG_REL_NS}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = posixpath.normpath(posixpath.join(directory, rel.get("Target")))
+        rels[rel.get("Id")] = (rel.get("Type"), target.lstrip("/"))
+    return rels
+
+
+def _rel_kind(rel_type):
+    # Transitional and strict relationship types share the last path segment
+    return rel_type.rsplit("/", 1)[-1]
+
+
+def _main_part(archive):
+    # The main part name is not fixed (Word Online writes word/document2.xml),
+    # so resolve it through the package relationships like python-docx does.
+    for rel_type, target in _read_rels(archive, "").values():
+        if _rel_kind(rel_type) == "officeDocument":
+            return target
+    raise ValueError("No officeDocument relationship found in package")
+
+
+def iter_docx_text(file_path):
+    with zipfile.ZipFile(file_path) as archive:
+        document = _main_part(archive)
+        with archive.open(document) as f:
+            yield from iter_paragraphs(f, WORD_TAGS)
+
+        # Footnotes, endnotes, headers, then footers, each in part number order
+        extra_parts = sorted({
+            (DOCX_EXTRA_RELS.index(_rel_kind(rel_type)), tuple(_natural_key(target)), target)
+            for rel_type, target in _read_rels(archive, document).values()
+            if _rel_kind(rel_type) in DOCX_EXTRA_RELS
+        })
+        for _, _, part in extra_parts:
+            with archive.open(part) as f:
+                yield from iter_paragraphs(f, WORD_TAGS, keep_empty=False)
+
+
+def _slide_parts(archive):
+    presentation = _main_part(archive)
+    rels = _read_rels(archive, presentation)
+    with archive.open(presentation) as f:
+        root = ET.parse(f).getroot()
+    slides = []
+    for sld_id in root.iter(f"{{{P_NS}}}sldId"):
+        rel = rels.get(sld_id.get(f"{{{R_NS}}}id"))
+        if rel:
+            slides.append(rel[1])
+    return slides
+
+
+def iter_pptx_text(file_path):
+    with zipfile.ZipFile(file_path) as archive:
+        for slide in _slide_parts(archive):
+            with archive.open(slide) as f:
+                yield from iter_paragraphs(f, DRAWING_TAGS)
+
+            for rel_type, target in _read_rels(archive, slide).values():
+                if rel_type == NOTES_SLIDE_REL:
+                    # Notes slides also carry the slide image, header and slide
+                    # number placeholders; only the body placeholder holds the notes.
+                    with archive.open(target) as f:
+                        yield from iter_paragraphs(f, DRAWING_TAGS, keep_empty=False, placeholder="body")
+
+
+def extract_docx_text(file_path):
+    return "\n".join(iter_docx_text(file_path))
+
+
+def extract_pptx_text(file_path):
+    return "\n".join(iter_pptx_text(file_path))
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+SQLITE_SUFFIXES = {'.db', '.sqlite', '.sqlite3'}
+JSONL_SUFFIXES = {'.jsonl'}
+
+RECORD_FIELDS = [
+    'input',
+    'fingerprint',
+    'model_alias',
+    'prompt_hash',
+    'response',
+    'input_tokens',
+    'output_tokens',
+    'extract_seconds',
+    'request_seconds',
+    'created_at',
+]
+
+# Batch mode runs tasks in threads that share one store
+_write_lock = threading.Lock()
+
+
+def sha256_text(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def make_record(input_file, input_text, model_alias, prompt, instructions, response, usage,
+                extract_seconds, request_seconds):
+    usage = usage or {}
+    return {
+        'input': input_file,
+        'fingerprint': sha256_text(input_text),
+        'model_alias': model_alias,
+        'prompt_hash': sha256_text(json.dumps([instructions, prompt])),
+        'response': response,
+        'input_tokens': usage.get('input_tokens'),
+        'output_tokens': usage.get('output_tokens'),
+        'extract_seconds': extract_seconds,
+        'request_seconds': request_seconds,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+    }
+
+
+class SQLiteStore:
+    def __init__(self, path):
+        self.path = Path(path)
+        # Shared by the batch threads; writes are serialised by _write_lock
+        self.conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                input TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                model_alias TEXT,
+                prompt_hash TEXT NOT NULL,
+                response TEXT,
+                input_tokens INTEGER,
+                output_tokens INTEGER,
+                extract_seconds REAL,
+                request_seconds REAL,
+                created_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_results_input ON results (input);
+            CREATE INDEX IF NOT EXISTS idx_results_fingerprint ON results (fingerprint, model_alias, prompt_hash);
+        """)
+
+    def add(self, record):
+        placeholders = ', '.join('?' for _ in RECORD_FIELDS)
+        with _write_lock, self.conn:
+            self.conn.execute(
+                f"INSERT INTO results ({', '.join(RECORD_FIELDS)}) VALUES ({placeholders})",
+                [record.get(field) for field in RECORD_FIELDS],
+            )
+
+    def iter_records(self, input_file=None):
+        query = f"SELECT {', '.join(RECORD_FIELDS)} FROM results"
+        params = []
+        if input_file:
+            query += " WHERE input = ?"
+            params.append(input_file)
+        query += " ORDER BY id"
+        for row in self.conn.execute(query, params):
+            yield dict(zip(RECORD_FIELDS, row))
+
+    def iter_latest_records(self, input_file=None):
+        """Yield only the most recent record of each input, one row at a time."""
+        latest = "SELECT MAX(id) FROM results"
+        params = []
+        if input_file:
+            latest += " WHERE input = ?"
+            params.append(input_file)
+        query = (
+            f"SELECT {', '.join(RECORD_FIELDS)} FROM results "
+            f"WHERE id IN ({latest} GROUP BY input) ORDER BY id"
+        )
+        for row in self.conn.execute(query, params):
+            yield dict(zip(RECORD_FIELDS, row))
+
+    def close(self):
+        self.conn.close()
+
+
+class JSONLStore:
+    """Append-only JSONL file with a sidecar `.idx` file of byte offsets per input."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + '.idx')
+
+    def add(self, record):
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+        with _write_lock:
+            with open(self.path, 'ab') as f:
+                offset = f.seek(0, 2)
+                f.write(line)
+            entry = {'input': record['input'], 'offset': offset, 'length': len(line)}
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def iter_records(self, input_file=None):
+        if not self.path.exists():
+            return
+        if input_file is None:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            return
+
+        # Use the offset index to seek straight to the matching records
+        entries = (entry for entry in self._iter_index() if entry['input'] == input_file)
+        yield from self._read_entries(entries)
+
+    def iter_latest_records(self, input_file=None):
+        """Yield only the most recent record of each input, one record at a time."""
+        if not self.path.exists():
+            return
+        # Only the offsets are kept in memory, never the responses
+        latest = {}
+        for entry in self._iter_index():
+            if input_file is None or entry['input'] == input_file:
+                latest[entry['input']] = entry
+        yield from self._read_entries(sorted(latest.values(), key=lambda entry: entry['offset']))
+
+    def _iter_index(self):
+        """Yield the index entries, rebuilding any part that is missing or torn.
+
+        The index is derived from the JSONL file, so if the two drifted apart (the
+        .idx file was deleted, or a write was interrupted between the two files)
+        the records past the last valid entry are scanned and re-indexed.
+        """
+        size = self.path.stat().st_size
+        indexed_end = 0
+        valid_length = 0
+        if self.index_path.exists():
+            with open(self.index_path, 'rb') as idx:
+                for line in idx:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    end = entry['offset'] + entry['length']
+                    if not line.endswith(b"\n") or end > size:
+                        break
+                    valid_length += len(line)
+                    indexed_end = max(indexed_end, end)
+                    yield entry
+        if indexed_end < size:
+            yield from self._rebuild_index(indexed_end, valid_length)
+
+    def _rebuild_index(self, offset, valid_length):
+        entries = []
+        with _write_lock:
+            with open(self.path, 'rb') as f, open(self.index_path, 'ab') as idx:
+                # Drop a torn tail so the rebuilt entries start on a fresh line
+                idx.truncate(valid_length)
+                f.seek(offset)
+                for line in iter(f.readline, b""):
+                    if line.endswith(b"\n") and line.strip():
+                        record = json.loads(line)
+                        entry = {'input': record['input'], 'offset': offset, 'length': len(line)}
+                        idx.write((json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8'))
+                        entries.append(entry)
+                    offset += len(line)
+        return entries
+
+    def _read_entries(self, entries):
+        with open(self.path, 'rb') as f:
+            for entry in entries:
+                f.seek(entry['offset'])
+                yield json.loads(f.read(entry['length']).decode('utf-8'))
+
+    def close(self):
+        pass
+
+
+def open_store(path):
+    suffix = Path(path).suffix.lower()
+    if suffix in SQLITE_SUFFIXES:
+        return SQLiteStore(path)
+    if suffix in JSONL_SUFFIXES:
+        return JSONLStore(path)
+    raise ValueError(
+        f"Unsupported output store {path}: use a {', '.join(sorted(SQLITE_SUFFIXES))} "
+        f"file for SQLite or a .jsonl file for JSONL"
+    )
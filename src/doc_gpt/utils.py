@@ -1,4 +1,5 @@
 from pathlib import Path
+import time
 import PyPDF2
 import click
 from docx import Document
@@ -10,6 +11,10 @@ from urllib.parse import urlparse
 
 from doc_gpt.config import get_config
 from .ai_client import AIClient
+from .ooxml import extract_docx_text, extract_pptx_text
+from .store import make_record, open_store, sha256_text
+
+EXTRACTORS = ['library', 'ooxml']
 
 def is_valid_url(url):
     url_pattern = re.compile(
@@ -33,7 +38,7 @@ def scrape_url(url):
         print(f"Error scraping URL {url}: {str(e)}")
         return ""
 
-def process_input(input_path):
+def process_input(input_path, extractor='library'):
     if is_valid_url(input_path):
         return scrape_url(input_path)
     
@@ -46,12 +51,12 @@ def process_input(input_path):
     if input_path.is_dir():
         content = ""
         for file in input_path.glob('*'):
-            content += process_file(file) + "\n\n"
+            content += process_file(file, extractor) + "\n\n"
         return content.strip()
     else:
-        return process_file(input_path)
+        return process_file(input_path, extractor)
 
-def process_file(file_path):
+def process_file(file_path, extractor='library'):
     ext = file_path.suffix.lower()
     
     try:
@@ -61,8 +66,12 @@ def process_file(file_path):
         elif ext == '.pdf':
             return process_pdf(file_path)
         elif ext == '.docx':
+            if extractor == 'ooxml':
+                return extract_docx_text(file_path)
             return process_docx(file_path)
         elif ext == '.pptx':
+            if extractor == 'ooxml':
+                return extract_pptx_text(file_path)
             return process_pptx(file_path)
         else:
             print(f"Warning: Unsupported file type {ext} for {file_path}")
@@ -131,10 +140,53 @@ def write_output(content, output, input_file):
     
     print(f"Output written to {str(output)}")
 
-def process_task(input_file, output_file, model_alias, prompt_file, instructions_file, write_prompt=False, max_tokens=None):
+def store_key(input_file):
+    """Key an input in the results store: URLs as given, local paths made absolute."""
+    if is_valid_url(input_file):
+        return input_file
+    # docs/a.txt, ./docs/a.txt and /abs/docs/a.txt are the same input
+    return str(Path(input_file).resolve())
+
+def output_filename(input_file, used_names):
+    """Pick a .doc-gpt.md name for input_file that is not yet in used_names."""
+    if is_valid_url(input_file):
+        name = url_to_valid_filename(input_file)
+    else:
+        # Keep the extension so report.pdf and report.docx stay apart
+        name = Path(input_file).name + ".doc-gpt.md"
+    if name in used_names:
+        # Same file name from another directory (or a truncated URL)
+        stem = name[:-len(".doc-gpt.md")]
+        name = f"{stem}.{sha256_text(input_file)[:8]}.doc-gpt.md"
+    if name in used_names:
+        raise click.ClickException(f"Cannot find a unique output file name for {input_file}")
+    used_names.add(name)
+    return name
+
+def export_store(output_store, output_dir=None, input_file=None):
+    """Write the latest stored response of each input to a Markdown file in output_dir."""
+    output_dir = Path(output_dir or Path.cwd())
+    output_dir.mkdir(parents=True, exist_ok=True)
+    used_names = set()
+    if input_file:
+        input_file = store_key(input_file)
+    store = open_store(output_store)
+    try:
+        for record in store.iter_latest_records(input_file):
+            output = output_dir / output_filename(record['input'], used_names)
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write((record['response'] or "") + "\n")
+            print(f"Output written to {str(output)}")
+    finally:
+        store.close()
+    return len(used_names)
+
+def process_task(input_file, output_file, model_alias, prompt_file, instructions_file, write_prompt=False, max_tokens=None, extractor='library', output_store=None):
     try:
         client = AIClient(get_config())
-        input_text = process_input(input_file)
+        extract_start = time.perf_counter()
+        input_text = process_input(input_file, extractor)
+        extract_seconds = time.perf_counter() - extract_start
 
         if prompt_file:
             prompt = process_input(prompt_file)
@@ -169,7 +221,9 @@ def process_task(input_file, output_file, model_alias, prompt_file, instructions
 """.replace("[document]", input_text).replace("[prompt]", prompt)
         messages.append({"role": "user", "content": message})
         print(f'Processing: "{input_file}"')
+        request_start = time.perf_counter()
         response = client.request(messages, model_alias, max_tokens)
+        request_seconds = time.perf_counter() - request_start
 
         # Decide what to write based on the write_prompt flag
         if write_prompt:
@@ -177,10 +231,19 @@ def process_task(input_file, output_file, model_alias, prompt_file, instructions
                 f"**Role:** {m['role']}\n**Content:**\n{m['content']}\n"
                 for m in messages
             )
-            combined_content = f"# Prompt:\n{formatted_prompt}\n\n# Response:\n{response}\n"
-            write_output(combined_content, output_file, input_file)
+            content = f"# Prompt:\n{formatted_prompt}\n\n# Response:\n{response}\n"
+        else:
+            content = response
+
+        if output_store:
+            output_store.add(make_record(
+                store_key(input_file), input_text, model_alias or client.config.get('default_model'),
+                prompt, instructions, content, client.last_usage,
+                extract_seconds, request_seconds,
+            ))
+            print(f"Output stored in {output_store.path}")
         else:
-            write_output(response, output_file, input_file)
+            write_output(content, output_file, input_file)
 
         click.echo("Content generation completed successfully.")
     except click.UsageError as e:
@@ -0,0 +1,225 @@
+import zipfile
+
+import pytest
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.opc.constants import CONTENT_TYPE, RELATIONSHIP_TYPE
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+from docx.oxml import parse_xml
+from pptx import Presentation
+from pptx.util import Inches
+
+from doc_gpt.ooxml import extract_docx_text, extract_pptx_text
+from doc_gpt.utils import process_docx, process_file, process_pptx
+
+
+def save_docx(doc, tmp_path):
+    path = tmp_path / "doc.docx"
+    doc.save(str(path))
+    return path
+
+
+def save_pptx(prs, tmp_path):
+    path = tmp_path / "deck.pptx"
+    prs.save(str(path))
+    return path
+
+
+W_NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+)
+
+
+def append_xml(paragraph, xml):
+    paragraph._p.append(parse_xml(xml.replace("NAMESPACES", W_NAMESPACES)))
+
+
+def rename_part(path, old, new):
+    """Rewrite the package so the part `old` is stored as `new`, as Word Online does."""
+    old_rels = old.replace("/", "/_rels/", 1) + ".rels"
+    new_rels = new.replace("/", "/_rels/", 1) + ".rels"
+    with zipfile.ZipFile(path) as source:
+        items = [(info.filename, source.read(info)) for info in source.infolist()]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as target:
+        for name, data in items:
+            if name in ("[Content_Types].xml", "_rels/.rels"):
+                data = data.replace(old.encode(), new.encode())
+            target.writestr({old: new, old_rels: new_rels}.get(name, name), data)
+
+
+def add_text_slide(prs, title, body):
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = title
+    slide.placeholders[1].text = body
+    return slide
+
+
+def test_docx_plain_paragraphs_match_library(tmp_path):
+    doc = Document()
+    doc.add_paragraph("First paragraph")
+    doc.add_paragraph("")
+    doc.add_paragraph("Third paragraph")
+    path = save_docx(doc, tmp_path)
+
+    assert extract_docx_text(path) == process_docx(path) == "First paragraph\n\nThird paragraph"
+
+
+def test_docx_tabs_and_breaks_match_library(tmp_path):
+    doc = Document()
+    doc.add_paragraph("name\tvalue")
+    paragraph = doc.add_paragraph("line one")
+    paragraph.runs[0].add_break()
+    paragraph.add_run("line two")
+    paragraph = doc.add_paragraph("before")
+    paragraph.runs[0].add_break(WD_BREAK.PAGE)
+    paragraph.add_run("after")
+    paragraph = doc.add_paragraph("left")
+    paragraph.runs[0].add_break(WD_BREAK.COLUMN)
+    paragraph.add_run("right")
+    path = save_docx(doc, tmp_path)
+
+    assert extract_docx_text(path) == process_docx(path)
+    assert extract_docx_text(path) == "name\tvalue\nline one\nline two\nbeforeafter\nleftright"
+
+
+def test_docx_tables_are_read_in_document_order(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Intro")
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "A"
+    table.cell(1, 1).text = "D"
+    doc.add_paragraph("End")
+    path = save_docx(doc, tmp_path)
+
+    # The library extractor only sees body paragraphs
+    assert process_docx(path) == "Intro\nEnd"
+    assert extract_docx_text(path) == "Intro\nA\n\n\nD\nEnd"
+
+
+def test_docx_headers_and_footers_follow_body(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Body")
+    doc.sections[0].header.paragraphs[0].text = "Header text"
+    doc.sections[0].footer.paragraphs[0].text = "Footer text"
+    path = save_docx(doc, tmp_path)
+
+    assert process_docx(path) == "Body"
+    assert extract_docx_text(path) == "Body\nHeader text\nFooter text"
+
+
+def test_docx_footnotes_and_endnotes_follow_body(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Body")
+    for name, tag, reltype, text in [
+        ("footnotes", "footnote", RELATIONSHIP_TYPE.FOOTNOTES, "A footnote"),
+        ("endnotes", "endnote", RELATIONSHIP_TYPE.ENDNOTES, "An endnote"),
+    ]:
+        blob = (
+            f'<w:{name} {W_NAMESPACES}>'
+            f'<w:{tag} w:type="separator" w:id="-1"><w:p><w:r><w:separator/></w:r></w:p></w:{tag}>'
+            f'<w:{tag} w:id="1"><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:{tag}>'
+            f'</w:{name}>'
+        ).encode()
+        content_type = getattr(CONTENT_TYPE, f"WML_{name.upper()}")
+        part = Part(PackURI(f"/word/{name}.xml"), content_type, blob, doc.part.package)
+        doc.part.relate_to(part, reltype)
+    doc.sections[0].header.paragraphs[0].text = "Header text"
+    path = save_docx(doc, tmp_path)
+
+    assert process_docx(path) == "Body"
+    assert extract_docx_text(path) == "Body\nA footnote\nAn endnote\nHeader text"
+
+
+def test_docx_skips_tracked_move_source(tmp_path):
+    doc = Document()
+    paragraph = doc.add_paragraph("keep ")
+    append_xml(paragraph, '<w:ins NAMESPACES w:id="1" w:author="a"><w:r><w:t>inserted</w:t></w:r></w:ins>')
+    append_xml(paragraph, '<w:moveFrom NAMESPACES w:id="2" w:author="a"><w:r><w:t>MOVEDFROM</w:t></w:r></w:moveFrom>')
+    append_xml(paragraph, '<w:del NAMESPACES w:id="3" w:author="a"><w:r><w:delText>deleted</w:delText></w:r></w:del>')
+    path = save_docx(doc, tmp_path)
+
+    # The library extractor ignores all tracked-change runs; ooxml keeps the current text
+    assert process_docx(path) == "keep "
+    assert extract_docx_text(path) == "keep inserted"
+
+
+def test_docx_text_box_fallback_is_not_duplicated(tmp_path):
+    doc = Document()
+    paragraph = doc.add_paragraph("Anchor")
+    text_box = '<w:txbxContent><w:p><w:r><w:t>Boxed</w:t></w:r></w:p></w:txbxContent>'
+    append_xml(
+        paragraph,
+        f'<w:r NAMESPACES><mc:AlternateContent>'
+        f'<mc:Choice Requires="wps"><w:drawing>{text_box}</w:drawing></mc:Choice>'
+        f'<mc:Fallback><w:pict>{text_box}</w:pict></mc:Fallback>'
+        f'</mc:AlternateContent></w:r>',
+    )
+    path = save_docx(doc, tmp_path)
+
+    assert process_docx(path) == "Anchor"
+    assert extract_docx_text(path) == "Boxed\nAnchor"
+
+
+def test_docx_main_part_is_resolved_through_relationships(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Body")
+    doc.sections[0].header.paragraphs[0].text = "Header text"
+    path = save_docx(doc, tmp_path)
+    rename_part(path, "word/document.xml", "word/document2.xml")
+
+    assert process_docx(path) == "Body"
+    assert extract_docx_text(path) == "Body\nHeader text"
+
+
+def test_pptx_main_part_is_resolved_through_relationships(tmp_path):
+    prs = Presentation()
+    add_text_slide(prs, "Title", "Body")
+    path = save_pptx(prs, tmp_path)
+    rename_part(path, "ppt/presentation.xml", "ppt/presentation2.xml")
+
+    assert extract_pptx_text(path) == process_pptx(path) == "Title\nBody"
+
+
+def test_pptx_text_shapes_match_library(tmp_path):
+    prs = Presentation()
+    add_text_slide(prs, "Title one", "Body one\nsecond paragraph")
+    add_text_slide(prs, "Title two", "line\vbreak")
+    path = save_pptx(prs, tmp_path)
+
+    assert extract_pptx_text(path) == process_pptx(path)
+    assert extract_pptx_text(path) == "Title one\nBody one\nsecond paragraph\nTitle two\nline\vbreak"
+
+
+def test_pptx_grouped_shapes_are_read(tmp_path):
+    prs = Presentation()
+    slide = add_text_slide(prs, "Title", "Body")
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(0, 0, Inches(1), Inches(1)).text = "Grouped"
+    path = save_pptx(prs, tmp_path)
+
+    assert process_pptx(path) == "Title\nBody"
+    assert extract_pptx_text(path) == "Title\nBody\nGrouped"
+
+
+def test_pptx_notes_follow_their_slide(tmp_path):
+    prs = Presentation()
+    first = add_text_slide(prs, "First", "One")
+    first.notes_slide.notes_text_frame.text = "Speaker notes"
+    add_text_slide(prs, "Second", "Two")
+    path = save_pptx(prs, tmp_path)
+
+    assert process_pptx(path) == "First\nOne\nSecond\nTwo"
+    assert extract_pptx_text(path) == "First\nOne\nSpeaker notes\nSecond\nTwo"
+
+
+@pytest.mark.parametrize("extractor, expected", [("library", "Intro\nEnd"), ("ooxml", "Intro\nA\nEnd")])
+def test_process_file_selects_extractor(tmp_path, extractor, expected):
+    doc = Document()
+    doc.add_paragraph("Intro")
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "A"
+    doc.add_paragraph("End")
+    path = save_docx(doc, tmp_path)
+
+    assert process_file(path, extractor) == expected
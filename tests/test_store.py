@@ -0,0 +1,201 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+import doc_gpt.cli
+import doc_gpt.utils
+from doc_gpt.cli import main
+from doc_gpt.store import JSONLStore, SQLiteStore, open_store, sha256_text
+
+STORE_NAMES = ["results.db", "results.jsonl"]
+
+
+class StubClient:
+    def __init__(self, config):
+        self.config = {"default_model": "stub", "models": {}}
+        self.last_usage = None
+
+    def request(self, messages, model_alias=None, max_tokens=None):
+        self.last_usage = {"input_tokens": 12, "output_tokens": 3}
+        document = messages[-1]["content"].split("<ProvidedDocument>\n")[1].split("\n</ProvidedDocument>")[0]
+        return f"Summary of {document}"
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.setattr(doc_gpt.utils, "AIClient", StubClient)
+    monkeypatch.setattr(doc_gpt.utils, "get_config", lambda: {})
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "prompt.md").write_text("Summarize", encoding="utf-8")
+    return tmp_path
+
+
+def run(*args):
+    result = CliRunner().invoke(main, list(args))
+    assert result.exception is None, result.output
+    return result
+
+
+def generate(store, *inputs):
+    for input_path in inputs:
+        run("g", str(input_path), "-p", "prompt.md", "--output-store", store)
+
+
+def write_inputs(workdir, files):
+    for name, text in files.items():
+        path = workdir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+@pytest.mark.parametrize("store_name", STORE_NAMES)
+def test_round_trip(workdir, store_name):
+    write_inputs(workdir, {"docs/a.txt": "alpha", "docs/b.md": "beta"})
+    run("g", "docs", "-p", "prompt.md", "-b", "2", "--output-store", store_name)
+
+    store = open_store(store_name)
+    records = sorted(store.iter_records(), key=lambda record: record["input"])
+    store.close()
+
+    assert [record["input"] for record in records] == [str(workdir.resolve() / "docs" / name) for name in ("a.txt", "b.md")]
+    record = records[0]
+    assert record["response"] == "Summary of alpha"
+    assert record["fingerprint"] == sha256_text("alpha")
+    assert record["model_alias"] == "stub"
+    assert record["prompt_hash"] == sha256_text(json.dumps(["", "Summarize"]))
+    assert (record["input_tokens"], record["output_tokens"]) == (12, 3)
+    assert record["extract_seconds"] >= 0 and record["request_seconds"] >= 0
+    assert not list(workdir.glob("*.doc-gpt.md"))
+
+
+@pytest.mark.parametrize("store_name", STORE_NAMES)
+def test_export_latest_record_wins(workdir, store_name):
+    write_inputs(workdir, {"a.txt": "first"})
+    generate(store_name, "a.txt")
+    write_inputs(workdir, {"a.txt": "second"})
+    generate(store_name, "a.txt")
+
+    result = run("export", store_name, "-o", "out")
+
+    assert "Exported 1 response(s)" in result.output
+    assert (workdir / "out" / "a.txt.doc-gpt.md").read_text(encoding="utf-8") == "Summary of second\n"
+
+
+@pytest.mark.parametrize("store_name", STORE_NAMES)
+def test_export_single_input(workdir, store_name):
+    write_inputs(workdir, {"a.txt": "alpha", "b.txt": "beta"})
+    generate(store_name, "a.txt", "b.txt", "a.txt")
+
+    run("export", store_name, "-i", "b.txt", "-o", "out")
+
+    assert [path.name for path in (workdir / "out").iterdir()] == ["b.txt.doc-gpt.md"]
+
+
+@pytest.mark.parametrize("store_name", STORE_NAMES)
+def test_export_names_are_unique(workdir, store_name):
+    write_inputs(workdir, {"a/r.txt": "first", "b/r.txt": "second", "report.md": "md", "report.txt": "txt"})
+    generate(store_name, "a/r.txt", "b/r.txt", "report.md", "report.txt")
+
+    result = run("export", store_name, "-o", "out")
+
+    assert "Exported 4 response(s)" in result.output
+    names = sorted(path.name for path in (workdir / "out").iterdir())
+    suffix = sha256_text(str(workdir.resolve() / "b" / "r.txt"))[:8]
+    assert names == sorted(["r.txt.doc-gpt.md", f"r.txt.{suffix}.doc-gpt.md", "report.md.doc-gpt.md", "report.txt.doc-gpt.md"])
+
+
+@pytest.mark.parametrize("store_name", STORE_NAMES)
+def test_inputs_are_keyed_by_resolved_path(workdir, store_name):
+    write_inputs(workdir, {"docs/a.txt": "first"})
+    generate(store_name, "docs/a.txt")
+    write_inputs(workdir, {"docs/a.txt": "second"})
+    generate(store_name, str(workdir / "docs" / "a.txt"))
+
+    result = run("export", store_name, "-i", "./docs/a.txt", "-o", "out")
+
+    assert "Exported 1 response(s)" in result.output
+    assert [path.name for path in (workdir / "out").iterdir()] == ["a.txt.doc-gpt.md"]
+    assert (workdir / "out" / "a.txt.doc-gpt.md").read_text(encoding="utf-8") == "Summary of second\n"
+
+
+def read_index(workdir):
+    return [json.loads(line) for line in (workdir / "results.jsonl.idx").read_text(encoding="utf-8").splitlines()]
+
+
+def test_jsonl_lookup_uses_offset_index(workdir):
+    write_inputs(workdir, {"a.txt": "alpha", "b.txt": "beta"})
+    generate("results.jsonl", "a.txt", "b.txt")
+
+    entries = read_index(workdir)
+    assert [entry["input"] for entry in entries] == [str(workdir.resolve() / name) for name in ("a.txt", "b.txt")]
+    assert entries[1]["offset"] == entries[0]["length"]
+
+    # Lookups seek to the indexed offset instead of scanning the data file
+    entries[0]["input"], entries[1]["input"] = entries[1]["input"], entries[0]["input"]
+    (workdir / "results.jsonl.idx").write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+    store = JSONLStore("results.jsonl")
+    assert [record["response"] for record in store.iter_records(entries[0]["input"])] == ["Summary of alpha"]
+
+
+def test_jsonl_missing_index_is_rebuilt(workdir):
+    write_inputs(workdir, {"a.txt": "alpha", "b.txt": "beta"})
+    generate("results.jsonl", "a.txt", "b.txt")
+    entries = read_index(workdir)
+    (workdir / "results.jsonl.idx").unlink()
+
+    result = run("export", "results.jsonl", "-o", "out")
+
+    assert "Exported 2 response(s)" in result.output
+    assert read_index(workdir) == entries
+
+
+def test_jsonl_short_or_torn_index_is_rebuilt(workdir):
+    write_inputs(workdir, {"a.txt": "alpha", "b.txt": "beta", "c.txt": "gamma"})
+    generate("results.jsonl", "a.txt", "b.txt", "c.txt")
+    entries = read_index(workdir)
+    # Keep the first entry and a half-written second one
+    (workdir / "results.jsonl.idx").write_text(json.dumps(entries[0]) + "\n" + json.dumps(entries[1])[:10], encoding="utf-8")
+
+    result = run("export", "results.jsonl", "-i", "c.txt", "-o", "out")
+
+    assert "Exported 1 response(s)" in result.output
+    assert read_index(workdir) == entries
+
+
+def test_open_store_selects_backend(tmp_path):
+    store = open_store(tmp_path / "results.sqlite")
+    assert isinstance(store, SQLiteStore)
+    store.close()
+    assert isinstance(open_store(tmp_path / "results.jsonl"), JSONLStore)
+
+
+def test_open_store_rejects_unsupported_extension(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported output store"):
+        open_store(tmp_path / "results.txt")
+
+
+def test_generate_rejects_unsupported_store_before_requests(workdir, monkeypatch):
+    write_inputs(workdir, {"a.txt": "alpha"})
+    monkeypatch.setattr(doc_gpt.cli, "process_task", lambda *args: pytest.fail("task should not run"))
+
+    result = run("g", "a.txt", "-p", "prompt.md", "--output-store", "results.txt")
+
+    assert "Unsupported output store" in result.output
+
+
+def test_generate_rejects_output_with_store(workdir):
+    write_inputs(workdir, {"a.txt": "alpha"})
+
+    result = run("g", "a.txt", "-p", "prompt.md", "-o", "x.md", "--output-store", "results.db")
+
+    assert "--output cannot be used with --output-store" in result.output
+    assert not (workdir / "x.md").exists()
+    assert not (workdir / "results.db").exists()
+
+
+def test_generate_missing_input_leaves_no_store(workdir):
+    result = run("g", "missing.txt", "-p", "prompt.md", "--output-store", "results.db")
+
+    assert "does not exist" in result.output
+    assert not (workdir / "results.db").exists()